@@ -1,12 +1,15 @@
-from flask import Flask, jsonify, render_template
+from flask import Blueprint, Flask, current_app, g, jsonify, render_template
+from flask_cors import CORS
+import os
 import sqlite3
-import re
 from pathlib import Path
-import subprocess
-import sys
 import json
 from hashlib import sha256
 from datetime import datetime
+from classifiers.job_classifier import classify_job
+from db_init import init_db
+from evaluators.job_evaluator import evaluate_job
+from locations import normalize_location
 
 ROOT_DIR = Path(__file__).resolve().parent.parent
 BACKEND_DIR = Path(__file__).resolve().parent
@@ -14,8 +17,15 @@ FRONTEND_DIR = ROOT_DIR / "frontend"
 TEMPLATE_DIR = FRONTEND_DIR if FRONTEND_DIR.exists() else BACKEND_DIR / "templates"
 STATIC_DIR = FRONTEND_DIR if FRONTEND_DIR.exists() else BACKEND_DIR / "static"
 STATIC_URL_PATH = "/static"
-DB_PATH = ROOT_DIR / "db" / "jobs.db"
-JOBS_JSON_PATH = ROOT_DIR / "data" / "jobs.json"
+
+DEFAULT_CONFIG = {
+    "DB_PATH": os.getenv("JOBS_DB_PATH", str(ROOT_DIR / "db" / "jobs.db")),
+    "JOBS_JSON_PATH": os.getenv("JOBS_JSON_PATH", str(ROOT_DIR / "data" / "jobs.json")),
+    # Seconds a write waits on SQLite's lock (held by another worker or the collector).
+    "DB_WRITE_TIMEOUT": 30,
+}
+
+bp = Blueprint("jobs", __name__)
 
 
 def stable_job_hash(record):
@@ -23,9 +33,10 @@ def stable_job_hash(record):
     return sha256(str(key).encode("utf-8")).hexdigest()
 
 
-def hydrate_db_from_jobs_json(conn):
+def hydrate_db_from_jobs_json(conn, jobs_json_path):
     """Backfill DB from data/jobs.json when the DB only has seed/empty data."""
-    if not JOBS_JSON_PATH.exists():
+    jobs_json_path = Path(jobs_json_path)
+    if not jobs_json_path.exists():
         return
 
     cur = conn.cursor()
@@ -35,20 +46,21 @@ def hydrate_db_from_jobs_json(conn):
         return
 
     try:
-        raw_jobs = json.loads(JOBS_JSON_PATH.read_text(encoding="utf-8"))
+        raw_jobs = json.loads(jobs_json_path.read_text(encoding="utf-8"))
     except Exception:
         return
 
     now = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
-    inserted = 0
     for job in raw_jobs:
         if not isinstance(job, dict):
             continue
+        classified = classify_job(job)
         cur.execute(
             """
             INSERT OR IGNORE INTO applications
-            (external_id, company, title, location, url, source, date_posted, date_scraped, job_hash)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            (external_id, company, title, location, url, source, date_posted, date_scraped, job_hash,
+             experience_level, work_type)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """,
             (
                 str(job.get("id") or ""),
@@ -60,87 +72,123 @@ def hydrate_db_from_jobs_json(conn):
                 job.get("date_posted") or "",
                 now,
                 stable_job_hash(job),
+                classified["experience_level"],
+                classified["work_type"],
             ),
         )
-        inserted += cur.rowcount > 0
-
-    if inserted:
-        conn.commit()
-
-
-def ensure_database():
-    """Ensure SQLite DB schema exists using backend/db_init.py."""
-    DB_PATH.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(str(DB_PATH))
-    cur = conn.cursor()
-    cur.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='applications'")
-    has_apps_table = cur.fetchone() is not None
-    conn.close()
 
-    if not has_apps_table:
-        subprocess.run([sys.executable, str(ROOT_DIR / "backend" / "db_init.py")], check=True)
 
+def get_read_db():
+    """Per-request read-only connection (SQLite URI with mode=ro)."""
+    if "read_db" not in g:
+        db_uri = Path(current_app.config["DB_PATH"]).resolve().as_uri() + "?mode=ro"
+        g.read_db = sqlite3.connect(db_uri, uri=True)
+        g.read_db.row_factory = sqlite3.Row
+    return g.read_db
 
-app = Flask(
-    __name__,
-    template_folder=str(TEMPLATE_DIR),
-    static_folder=str(STATIC_DIR),
-    static_url_path=STATIC_URL_PATH,
-)
 
+def close_read_db(exc=None):
+    conn = g.pop("read_db", None)
+    if conn is not None:
+        conn.close()
 
-def normalize_location(loc):
-    """Normalize location strings for consistency."""
-    if not loc:
-        return "Unknown"
 
-    cleaned = loc.strip()
-    if "remote" in cleaned.lower():
-        return "Remote"
-
-    cleaned = re.sub(r"\s*-\s*", ", ", cleaned)
-    cleaned = re.sub(r",\s*,+", ",", cleaned)
-    return cleaned.strip(", ")
+def query_db(query, args=()):
+    cur = get_read_db().execute(query, args)
+    return [dict(row) for row in cur.fetchall()]
 
 
-def query_db(query, args=()):
-    ensure_database()
-    db_path = get_db_path()
-    conn = sqlite3.connect(str(db_path))
-    conn.row_factory = sqlite3.Row
-    hydrate_db_from_jobs_json(conn)
-    cur = conn.cursor()
-    cur.execute(query, args)
-    rows = cur.fetchall()
-    conn.close()
-    return [dict(row) for row in rows]
+def execute_write(query, args=()):
+    """
+    Run one write on a short-lived connection and commit it. Workers and the
+    collector write independently; SQLite's busy timeout arbitrates the lock.
+    """
+    conn = sqlite3.connect(current_app.config["DB_PATH"], timeout=current_app.config["DB_WRITE_TIMEOUT"])
+    try:
+        with conn:
+            conn.execute(query, args)
+    finally:
+        conn.close()
 
 
-@app.route("/")
+@bp.route("/")
 def index():
     return render_template("index.html")
 
 
-@app.route("/jobs")
+@bp.route("/jobs")
 def get_jobs():
-    rows = query_db("SELECT company, location, title, url FROM applications ORDER BY id DESC")
+    rows = query_db(
+        "SELECT company, location, title, url, score, evaluation_notes, experience_level, work_type "
+        "FROM applications ORDER BY id DESC"
+    )
     for row in rows:
         row["location"] = normalize_location(row.get("location"))
     return jsonify(rows)
 
 
-@app.route("/companies")
+@bp.route("/companies")
 def get_companies():
     rows = query_db("SELECT DISTINCT company FROM applications WHERE company IS NOT NULL AND company != '' ORDER BY company")
     return jsonify([row["company"] for row in rows])
 
 
-@app.route("/locations")
+@bp.route("/locations")
 def get_locations():
     rows = query_db("SELECT DISTINCT location FROM applications")
     locations = sorted({normalize_location(row.get("location")) for row in rows})
     return jsonify(locations)
 
 
+@bp.route("/evaluate/<int:job_id>", methods=["POST"])
+def evaluate_job_endpoint(job_id):
+    # Get job details
+    rows = query_db("SELECT title, company, location, url FROM applications WHERE id = ?", (job_id,))
+    if not rows:
+        return jsonify({"error": "Job not found"}), 404
+
+    job = rows[0]
+    # For description, perhaps fetch from URL or assume not available; use title as proxy
+    description = job.get("title", "")  # Placeholder
+
+    result = evaluate_job(job["title"], description, job["company"], job["location"])
+
+    execute_write(
+        "UPDATE applications SET score = ?, evaluation_notes = ? WHERE id = ?",
+        (result["score"], result["notes"], job_id),
+    )
+
+    return jsonify(result)
+
+
+def create_app(config=None):
+    """
+    Build the Flask app. `config` overrides DEFAULT_CONFIG (DB_PATH, JOBS_JSON_PATH,
+    DB_WRITE_TIMEOUT, plus any Flask settings); DB_PATH/JOBS_JSON_PATH default to
+    the JOBS_DB_PATH and JOBS_JSON_PATH environment variables.
+    """
+    app = Flask(
+        __name__,
+        template_folder=str(TEMPLATE_DIR),
+        static_folder=str(STATIC_DIR),
+        static_url_path=STATIC_URL_PATH,
+    )
+    app.config.update(DEFAULT_CONFIG)
+    if config:
+        app.config.update(config)
+    CORS(app)
+
+    # Idempotent and serialized across processes, so every worker can run it at boot.
+    init_db(app.config["DB_PATH"], populate=lambda conn: hydrate_db_from_jobs_json(conn, app.config["JOBS_JSON_PATH"]))
+
+    app.teardown_appcontext(close_read_db)
+    app.register_blueprint(bp)
+    return app
+
+
 if __name__ == "__main__":
-    app.run(debug=True)
+    # Development server only; serve backend/wsgi.py with a pre-forking server in production.
+    app = create_app()
+    print("Serving templates from:", TEMPLATE_DIR)
+    print("Serving static from:", STATIC_DIR, "at", STATIC_URL_PATH or "/")
+    app.run(debug=os.getenv("FLASK_DEBUG") == "1")
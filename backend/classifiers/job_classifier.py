@@ -0,0 +1,84 @@
+import argparse
+import re
+import sqlite3
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent.parent
+DB_PATH = ROOT_DIR / "db" / "jobs.db"
+
+ENTRY_RE = re.compile(r"\b(intern|junior|jr|entry)\b")
+EXECUTIVE_RE = re.compile(r"\b(staff|principal|architect|director|head|vp|executive|chief)\b")
+SENIOR_RE = re.compile(r"\b(senior|sr|lead)\b")
+
+
+def classify_experience(title):
+    """Bucket a job title into Entry / Mid / Senior / Executive ('' if no title)."""
+    title = (title or "").lower()
+    if ENTRY_RE.search(title):
+        return "Entry"
+    if EXECUTIVE_RE.search(title):
+        return "Executive"
+    if SENIOR_RE.search(title):
+        return "Senior"
+    if title:
+        return "Mid"
+    return ""
+
+
+def classify_work_type(location, title):
+    """Detect Hybrid / Remote / On-Site from location and title ('' if unknown)."""
+    combined = f"{location or ''} {title or ''}".lower()
+    if "hybrid" in combined:
+        return "Hybrid"
+    if "remote" in combined:
+        return "Remote"
+    if "on-site" in combined or "onsite" in combined:
+        return "On-Site"
+    return ""
+
+
+def classify_job(job_record):
+    """Return the precomputed classification columns for a job record."""
+    title = job_record.get("title")
+    return {
+        "experience_level": classify_experience(title),
+        "work_type": classify_work_type(job_record.get("location"), title),
+    }
+
+
+def backfill_classifications(conn, reclassify=False):
+    """
+    Populate experience_level/work_type on stored jobs.
+    Only unclassified rows are touched unless reclassify is set.
+    Returns the number of rows updated.
+    """
+    cursor = conn.cursor()
+    query = "SELECT id, title, location FROM applications"
+    if not reclassify:
+        query += " WHERE experience_level IS NULL OR work_type IS NULL"
+    cursor.execute(query)
+
+    updates = []
+    for job_id, title, location in cursor.fetchall():
+        classified = classify_job({"title": title, "location": location})
+        updates.append((classified["experience_level"], classified["work_type"], job_id))
+
+    if updates:
+        cursor.executemany("UPDATE applications SET experience_level = ?, work_type = ? WHERE id = ?", updates)
+        conn.commit()
+    return len(updates)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--db", default=str(DB_PATH), help="Path to jobs.db")
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help="Reclassify every job, not just rows missing a classification",
+    )
+    args = parser.parse_args()
+    conn = sqlite3.connect(args.db)
+    updated = backfill_classifications(conn, reclassify=args.all)
+    conn.close()
+    print(f"[DONE] classified {updated} jobs")
@@ -2,6 +2,7 @@ import argparse
 import json
 import requests
 import sqlite3
+import sys
 from hashlib import sha256
 from datetime import datetime
 from pathlib import Path
@@ -10,6 +11,11 @@ SOURCE = "greenhouse_direct"
 ROOT_DIR = Path(__file__).resolve().parent.parent.parent
 DB_PATH = ROOT_DIR / "db" / "jobs.db"
 
+sys.path.insert(0, str(ROOT_DIR / "backend"))
+from classifiers.job_classifier import classify_job  # noqa: E402
+from db_init import init_db  # noqa: E402
+from snapshot_builder import build_snapshot  # noqa: E402
+
 
 # --- Helper functions ---
 def sha256_hash(value):
@@ -34,11 +40,13 @@ def insert_job_if_new(conn, company, job_record):
         return False
 
     now = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
+    classified = classify_job(job_record)
     cursor.execute(
         """
         INSERT INTO applications
-        (external_id, company, title, location, url, source, date_posted, date_scraped, job_hash)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        (external_id, company, title, location, url, source, date_posted, date_scraped, job_hash,
+         experience_level, work_type)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         """,
         (
             job_record.get("external_id"),
@@ -50,12 +58,20 @@ def insert_job_if_new(conn, company, job_record):
             job_record.get("date_posted"),
             now,
             job_hash,
+            classified["experience_level"],
+            classified["work_type"],
         ),
     )
     conn.commit()
     return True
 
 
+def connect_db(db_path):
+    """Create/migrate the schema (no sample rows) so inserts match the current columns."""
+    init_db(db_path, seed_sample_data=False)
+    return sqlite3.connect(str(db_path))
+
+
 # --- Collector ---
 def fetch_jobs(handle, api_url=None):
     if not api_url:
@@ -66,7 +82,7 @@ def fetch_jobs(handle, api_url=None):
     return data.get("jobs", [])
 
 
-def main(companies_file, prune_bad=False):
+def main(companies_file, prune_bad=False, snapshot=True):
     print("[DEBUG] starting greenhouse collector")
 
     with open(companies_file, encoding="utf-8") as f:
@@ -74,8 +90,7 @@ def main(companies_file, prune_bad=False):
 
     print(f"[DEBUG] loaded {len(companies_list)} companies from {companies_file}")
 
-    DB_PATH.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(str(DB_PATH))
+    conn = connect_db(DB_PATH)
 
     total_added = 0
     bad_companies = []
@@ -138,6 +153,13 @@ def main(companies_file, prune_bad=False):
     print(f"[DONE] total added: {total_added}")
     conn.close()
 
+    if snapshot:
+        try:
+            manifest = build_snapshot(DB_PATH)
+            print(f"[INFO] rebuilt static snapshot ({manifest['job_count']} jobs)")
+        except (ValueError, sqlite3.Error) as e:
+            print(f"[ERROR] snapshot build failed: {e}")
+
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
@@ -147,5 +169,10 @@ if __name__ == "__main__":
         action="store_true",
         help="Remove handles that consistently fail with 404/503 from companies.json",
     )
+    parser.add_argument(
+        "--no-snapshot",
+        action="store_true",
+        help="Skip rebuilding the static snapshot (data/snapshot) after collecting",
+    )
     args = parser.parse_args()
-    main(args.companies, prune_bad=args.prune_bad)
+    main(args.companies, prune_bad=args.prune_bad, snapshot=not args.no_snapshot)
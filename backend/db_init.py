@@ -1,17 +1,53 @@
+import argparse
 import sqlite3
 from datetime import datetime
 from pathlib import Path
 
+from classifiers.job_classifier import backfill_classifications
+
 ROOT_DIR = Path(__file__).resolve().parent.parent
 DB_DIR = ROOT_DIR / "db"
 DB_PATH = DB_DIR / "jobs.db"
 
+# Columns added after the initial schema; ALTERed onto existing databases.
+APPLICATION_MIGRATIONS = {
+    "experience_level": "TEXT",
+    "work_type": "TEXT",
+}
+
+
+def init_db(db_path=DB_PATH, seed_sample_data=True, populate=None):
+    """
+    Create/migrate the schema, seed sample rows and run populate(conn), all in
+    one BEGIN IMMEDIATE transaction. Concurrent initializers (e.g. app workers
+    booting together) therefore run one after another, and each is a no-op once
+    the DB is set up.
+    """
+    db_path = Path(db_path)
+    db_path.parent.mkdir(parents=True, exist_ok=True)
 
-def init_db(seed_sample_data=True):
-    DB_DIR.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db_path, timeout=30, isolation_level=None)
+    # WAL lets read-only connections proceed while a write is in flight; it persists in the file.
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        init_schema(conn.cursor(), seed_sample_data)
+        if populate:
+            populate(conn)
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        conn.close()
+        raise
+
+    # Back to implicit transactions so the backfill UPDATEs commit as one batch.
+    conn.isolation_level = ""
+    backfill_classifications(conn)
+    conn.close()
+    print(f"Database initialized at {db_path}.")
 
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
+
+def init_schema(cursor, seed_sample_data=True):
 
     cursor.execute('''
         CREATE TABLE IF NOT EXISTS profiles (
@@ -40,10 +76,18 @@ def init_db(seed_sample_data=True):
             notes TEXT,
             score REAL,
             evaluation_notes TEXT,
-            job_hash TEXT UNIQUE
+            job_hash TEXT UNIQUE,
+            experience_level TEXT,
+            work_type TEXT
         )
     ''')
 
+    cursor.execute("PRAGMA table_info(applications)")
+    existing_columns = {row[1] for row in cursor.fetchall()}
+    for column, column_type in APPLICATION_MIGRATIONS.items():
+        if column not in existing_columns:
+            cursor.execute(f"ALTER TABLE applications ADD COLUMN {column} {column_type}")
+
     cursor.execute('''
         CREATE TABLE IF NOT EXISTS documents (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -92,10 +136,9 @@ def init_db(seed_sample_data=True):
                 "sample-job-123"
             ))
 
-    conn.commit()
-    conn.close()
-    print(f"Database initialized at {DB_PATH}.")
-
 
 if __name__ == "__main__":
-    init_db()
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--db", default=str(DB_PATH), help="Path to jobs.db")
+    args = parser.parse_args()
+    init_db(args.db)
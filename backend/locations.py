@@ -0,0 +1,15 @@
+import re
+
+
+def normalize_location(loc):
+    """Normalize location strings for consistency."""
+    if not loc:
+        return "Unknown"
+
+    cleaned = loc.strip()
+    if "remote" in cleaned.lower():
+        return "Remote"
+
+    cleaned = re.sub(r"\s*-\s*", ", ", cleaned)
+    cleaned = re.sub(r",\s*,+", ",", cleaned)
+    return cleaned.strip(", ")
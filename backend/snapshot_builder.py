@@ -0,0 +1,221 @@
+import argparse
+import gzip
+import json
+import os
+import re
+import sqlite3
+from collections import defaultdict
+from datetime import datetime
+from hashlib import sha256
+from pathlib import Path
+
+from locations import normalize_location
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+DB_PATH = ROOT_DIR / "db" / "jobs.db"
+SNAPSHOT_DIR = ROOT_DIR / "data" / "snapshot"
+FRONTEND_DIR = ROOT_DIR / "frontend"
+MANIFEST_NAME = "manifest.json"
+INDEX_NAME = "index.html"
+HASHED_NAME_RE = re.compile(r"\.[0-9a-f]{16}\.")
+STATIC_URL_RE = re.compile(r"\{\{\s*url_for\(\s*'static'\s*,\s*filename\s*=\s*'([^']+)'\s*\)\s*\}\}")
+SNAPSHOT_BASE_RE = re.compile(r'(<meta name="job-snapshot-base" content=")[^"]*(")')
+PARTITIONS = ("company", "location")
+JOB_COLUMNS = ("id", "company", "location", "title", "url", "score", "evaluation_notes", "experience_level", "work_type")
+FACET_FIELDS = {
+    "companies": "company",
+    "locations": "location",
+    "experience_levels": "experience_level",
+    "work_types": "work_type",
+}
+
+
+def load_jobs(db_path):
+    """Read jobs in /jobs order and shape, with locations normalized."""
+    db_uri = Path(db_path).resolve().as_uri() + "?mode=ro"
+    conn = sqlite3.connect(db_uri, uri=True)
+    conn.row_factory = sqlite3.Row
+    existing_columns = {row["name"] for row in conn.execute("PRAGMA table_info(applications)")}
+    missing = [column for column in JOB_COLUMNS if column not in existing_columns]
+    if missing:
+        conn.close()
+        raise ValueError(
+            f"{db_path}: applications table is missing column(s) {', '.join(missing)}; "
+            "run backend/db_init.py to create/migrate the schema"
+        )
+    rows = conn.execute(f"SELECT {', '.join(JOB_COLUMNS)} FROM applications ORDER BY id DESC").fetchall()
+    conn.close()
+
+    jobs = []
+    for row in rows:
+        job = dict(row)
+        job["company"] = job.get("company") or ""
+        job["location"] = normalize_location(job.get("location"))
+        jobs.append(job)
+    return jobs
+
+
+def slugify(value):
+    slug = re.sub(r"[^a-z0-9]+", "-", (value or "").lower()).strip("-")
+    return slug[:60] or "unknown"
+
+
+def replace_file(target, data):
+    """Atomically write bytes to target."""
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp = target.with_name(target.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, target)
+
+
+def write_hashed(out_dir, rel_stem, payload):
+    """
+    Write payload as <rel_stem>.<hash>.json.gz and return the relative path.
+    The hash covers the JSON body, and gzip mtime is pinned, so unchanged data
+    keeps the same file name (and CDN cache entry) across builds.
+    """
+    body = json.dumps(payload, ensure_ascii=False, separators=(",", ":"), sort_keys=True).encode("utf-8")
+    digest = sha256(body).hexdigest()[:16]
+    rel_path = f"{rel_stem}.{digest}.json.gz"
+    if not (out_dir / rel_path).exists():
+        replace_file(out_dir / rel_path, gzip.compress(body, compresslevel=9, mtime=0))
+    return rel_path
+
+
+def write_hashed_asset(out_dir, rel_path, data):
+    """Copy a frontend asset as <stem>.<hash>.<ext> (e.g. css/styles.<hash>.css)."""
+    stem, _, ext = rel_path.rpartition(".")
+    hashed_path = f"{stem}.{sha256(data).hexdigest()[:16]}.{ext}"
+    if not (out_dir / hashed_path).exists():
+        replace_file(out_dir / hashed_path, data)
+    return hashed_path
+
+
+def build_index(out_dir, frontend_dir):
+    """
+    Render frontend/index.html as a plain static page: url_for('static', ...)
+    becomes a relative path to a hashed copy of the asset, and the snapshot
+    base points at this directory. Returns {asset filename: hashed path}.
+    """
+    template_path = Path(frontend_dir) / INDEX_NAME
+    if not template_path.exists():
+        return {}
+
+    assets = {}
+
+    def asset_url(match):
+        filename = match.group(1)
+        if filename not in assets:
+            assets[filename] = write_hashed_asset(out_dir, filename, (Path(frontend_dir) / filename).read_bytes())
+        return assets[filename]
+
+    html = STATIC_URL_RE.sub(asset_url, template_path.read_text(encoding="utf-8"))
+    html = SNAPSHOT_BASE_RE.sub(r"\1.\2", html)
+    replace_file(out_dir / INDEX_NAME, html.encode("utf-8"))
+    return assets
+
+
+def build_facets(jobs):
+    facets = {}
+    for facet_name, field in FACET_FIELDS.items():
+        counts = defaultdict(int)
+        for job in jobs:
+            if job.get(field):
+                counts[job[field]] += 1
+        facets[facet_name] = [{"name": name, "count": counts[name]} for name in sorted(counts, key=str.lower)]
+    return facets
+
+
+def referenced_paths(manifest):
+    paths = {manifest["facets"], manifest["jobs"]["path"]}
+    paths.update(manifest.get("assets", {}).values())
+    for shards in manifest["shards"].values():
+        paths.update(shard["path"] for shard in shards.values())
+    return paths
+
+
+def prune_snapshot(out_dir, keep):
+    """Delete hashed files referenced by neither the new nor the previous manifest."""
+    for path in out_dir.rglob("*"):
+        if not path.is_file() or not HASHED_NAME_RE.search(path.name):
+            continue
+        if path.relative_to(out_dir).as_posix() not in keep:
+            path.unlink()
+
+
+def build_snapshot(db_path=DB_PATH, out_dir=SNAPSHOT_DIR, frontend_dir=FRONTEND_DIR):
+    """
+    Emit a static snapshot of the job board, servable as-is from a CDN:
+    - index.html plus hashed copies of its css/js, loading data from this directory
+    - jobs/all.<hash>.json.gz: every job, for the frontend's initial load
+    - jobs/<partition>/<slug>.<hash>.json.gz: job shards, partitioned by company and by location
+    - facets.<hash>.json.gz: facet values with counts
+    - manifest.json: entry point listing the above
+    index.html and manifest.json are the only un-hashed files; serve them no-cache.
+    Returns the manifest.
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = out_dir / MANIFEST_NAME
+
+    previous = None
+    if manifest_path.exists():
+        try:
+            previous = json.loads(manifest_path.read_text(encoding="utf-8"))
+        except Exception:
+            previous = None
+
+    jobs = load_jobs(db_path)
+
+    shards = {}
+    for partition in PARTITIONS:
+        groups = defaultdict(list)
+        for job in jobs:
+            groups[job[partition]].append(job)
+        shards[partition] = {
+            name: {
+                "path": write_hashed(out_dir, f"jobs/{partition}/{slugify(name)}", group),
+                "count": len(group),
+            }
+            for name, group in sorted(groups.items())
+        }
+
+    assets = build_index(out_dir, frontend_dir)
+
+    manifest = {
+        "generated_at": datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S"),
+        "job_count": len(jobs),
+        "facets": write_hashed(out_dir, "facets", build_facets(jobs)),
+        "jobs": {"path": write_hashed(out_dir, "jobs/all", jobs), "count": len(jobs)},
+        "shards": shards,
+        "assets": assets,
+    }
+
+    tmp = manifest_path.with_name(MANIFEST_NAME + ".tmp")
+    tmp.write_text(json.dumps(manifest, indent=2, ensure_ascii=False), encoding="utf-8")
+    os.replace(tmp, manifest_path)
+
+    keep = referenced_paths(manifest)
+    if previous:
+        try:
+            keep |= referenced_paths(previous)
+        except (KeyError, TypeError, AttributeError):
+            pass
+    prune_snapshot(out_dir, keep)
+    return manifest
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--db", default=str(DB_PATH), help="Path to jobs.db")
+    parser.add_argument("--out", default=str(SNAPSHOT_DIR), help="Snapshot output directory")
+    args = parser.parse_args()
+    try:
+        manifest = build_snapshot(args.db, args.out)
+    except (ValueError, sqlite3.Error) as e:
+        raise SystemExit(f"[ERROR] snapshot build failed: {e}")
+    print(
+        f"[DONE] snapshot of {manifest['job_count']} jobs "
+        f"({len(manifest['shards']['company'])} company / {len(manifest['shards']['location'])} location shards) "
+        f"written to {args.out}"
+    )
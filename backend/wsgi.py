@@ -0,0 +1,10 @@
+"""
+WSGI entry point for pre-forking servers, e.g.:
+
+    gunicorn --chdir backend --workers 4 wsgi:app
+
+Configure the database with JOBS_DB_PATH (and JOBS_JSON_PATH) in the environment.
+"""
+from app import create_app
+
+app = create_app()
@@ -1,30 +1,35 @@
 let jobsData = [];
-
-function deriveExperience(job) {
-  const explicit = job.experience_level || job.experience || '';
-  if (explicit) return explicit;
-
-  const title = (job.title || '').toLowerCase();
-  if (/\b(intern|junior|jr|entry)\b/.test(title)) return 'Entry';
-  if (/\b(staff|principal|architect|director|head|vp|executive|chief)\b/.test(title)) return 'Executive';
-  if (/\b(senior|sr|lead)\b/.test(title)) return 'Senior';
-  if (title) return 'Mid';
-  return '';
+let filteredJobs = [];
+
+// Rows are fixed-height so the visible window can be computed from scrollTop alone.
+// The height comes from --row-height on .table-container in styles.css.
+const ROW_HEIGHT = parseFloat(
+  getComputedStyle(document.getElementById('tableContainer')).getPropertyValue('--row-height')
+);
+const OVERSCAN_ROWS = 10;
+const FILTER_DEBOUNCE_MS = 150;
+let currentSearchTerm = '';
+let renderedRange = { start: -1, end: -1 };
+let scrollFramePending = false;
+
+function debounce(fn, waitMs) {
+  let timer = null;
+  return (...args) => {
+    clearTimeout(timer);
+    timer = setTimeout(() => fn(...args), waitMs);
+  };
 }
 
-function deriveWorkType(job) {
-  const explicit = job.work_type || '';
-  if (explicit) return explicit;
-
-  const location = (job.location || '').toLowerCase();
-  const title = (job.title || '').toLowerCase();
-  const combined = `${location} ${title}`;
-
-  if (combined.includes('hybrid')) return 'Hybrid';
-  if (combined.includes('remote')) return 'Remote';
-  if (combined.includes('on-site') || combined.includes('onsite')) return 'On-Site';
+function escapeHtml(text) {
+  return String(text)
+    .replace(/&/g, '&amp;')
+    .replace(/</g, '&lt;')
+    .replace(/>/g, '&gt;')
+    .replace(/"/g, '&quot;');
+}
 
-  return '';
+function escapeRegExp(text) {
+  return text.replace(/[.*+?^${}()|[\]\\]/g, '\\$&');
 }
 
 function uniqSorted(values) {
@@ -84,19 +89,55 @@ function setupCustomSelect(wrapperId, hiddenId, options, defaultLabel) {
   });
 }
 
-async function fetchData() {
+async function fetchFromApi() {
   const [jobsRes, companiesRes, locationsRes] = await Promise.all([
     fetch('/jobs'),
     fetch('/companies'),
     fetch('/locations')
   ]);
 
-  jobsData = await jobsRes.json();
-  const companies = await companiesRes.json();
-  const locations = await locationsRes.json();
+  return {
+    jobs: await jobsRes.json(),
+    companies: await companiesRes.json(),
+    locations: await locationsRes.json()
+  };
+}
+
+// Static snapshot built by backend/snapshot_builder.py: the manifest is the only
+// un-hashed JSON file. The initial load needs just the facets and the all-jobs shard;
+// the per-company/location shards are for consumers that want a single partition.
+async function fetchFromSnapshot(base) {
+  const manifest = await (await fetch(`${base}/manifest.json`, { cache: 'no-cache' })).json();
+  const [facets, jobs] = await Promise.all(
+    [manifest.facets, manifest.jobs.path].map((path) => fetch(`${base}/${path}`).then((res) => res.json()))
+  );
+
+  return {
+    jobs,
+    companies: facets.companies.map((facet) => facet.name),
+    locations: facets.locations.map((facet) => facet.name)
+  };
+}
 
-  const experienceLevels = uniqSorted(jobsData.map(deriveExperience));
-  const workTypes = uniqSorted(jobsData.map(deriveWorkType));
+async function fetchData() {
+  const snapshotMeta = document.querySelector('meta[name="job-snapshot-base"]');
+  const snapshotBase = snapshotMeta ? snapshotMeta.content.replace(/\/+$/, '') : '';
+  const { jobs, companies, locations } = snapshotBase
+    ? await fetchFromSnapshot(snapshotBase)
+    : await fetchFromApi();
+
+  // experience_level / work_type are classified at ingest; only lowercase once here.
+  jobsData = jobs.map((job) => ({
+    ...job,
+    companyText: (job.company || '').toLowerCase(),
+    locationText: (job.location || '').toLowerCase(),
+    titleText: (job.title || '').toLowerCase(),
+    experienceText: (job.experience_level || '').toLowerCase(),
+    workTypeText: (job.work_type || '').toLowerCase()
+  }));
+
+  const experienceLevels = uniqSorted(jobsData.map((job) => job.experience_level));
+  const workTypes = uniqSorted(jobsData.map((job) => job.work_type));
   const scores = ['All', '4+', '3+', '2+', '1+', '0+'];
 
   setupCustomSelect('companyCustom', 'companyFilter', companies, 'All Companies');
@@ -105,70 +146,99 @@ async function fetchData() {
   setupCustomSelect('workTypeCustom', 'workTypeFilter', workTypes, 'All Work Types');
   setupCustomSelect('scoreCustom', 'scoreFilter', scores, 'All Scores');
 
-  renderJobs();
+  applyFilters();
 }
 
+// Match on the raw text and escape each piece, so a term never matches inside an entity.
 function highlightMatch(text, searchTerm) {
-  if (!searchTerm) return text;
-  const regex = new RegExp(`(${searchTerm})`, 'gi');
-  return text.replace(regex, '<mark>$1</mark>');
+  if (!searchTerm) return escapeHtml(text);
+  const regex = new RegExp(`(${escapeRegExp(searchTerm)})`, 'gi');
+  return String(text)
+    .split(regex)
+    .map((part, idx) => (idx % 2 ? `<mark>${escapeHtml(part)}</mark>` : escapeHtml(part)))
+    .join('');
 }
 
-function renderJobs() {
+function applyFilters() {
   const company = document.getElementById('companyFilter').value.toLowerCase();
   const location = document.getElementById('locationFilter').value.toLowerCase();
   const searchTerm = document.getElementById('searchInput').value.toLowerCase();
   const experience = document.getElementById('experienceFilter').value.toLowerCase();
   const workType = document.getElementById('workTypeFilter').value.toLowerCase();
   const scoreFilter = document.getElementById('scoreFilter').value;
-  const tbody = document.querySelector('#jobsTable tbody');
-  tbody.innerHTML = '';
-
-  const filtered = jobsData.filter((job) => {
-    const companyText = (job.company || '').toLowerCase();
-    const locationText = (job.location || '').toLowerCase();
-    const titleText = (job.title || '').toLowerCase();
-    const experienceText = deriveExperience(job).toLowerCase();
-    const workTypeText = deriveWorkType(job).toLowerCase();
-
-    const matchCompany = !company || companyText === company;
-    const matchLocation = !location || locationText === location;
-    const matchExperience = !experience || experienceText === experience;
-    const matchWorkType = !workType || workTypeText === workType;
+  const minScore = scoreFilter && scoreFilter !== 'All' ? parseFloat(scoreFilter.replace('+', '')) : null;
+
+  filteredJobs = jobsData.filter((job) => {
+    const matchCompany = !company || job.companyText === company;
+    const matchLocation = !location || job.locationText === location;
+    const matchExperience = !experience || job.experienceText === experience;
+    const matchWorkType = !workType || job.workTypeText === workType;
     const matchSearch = !searchTerm
-      || titleText.includes(searchTerm)
-      || companyText.includes(searchTerm)
-      || locationText.includes(searchTerm);
-
-    let matchScore = true;
-    if (scoreFilter && scoreFilter !== 'All') {
-      const minScore = parseFloat(scoreFilter.replace('+', ''));
-      const jobScore = job.score || 0;
-      matchScore = jobScore >= minScore;
-    }
+      || job.titleText.includes(searchTerm)
+      || job.companyText.includes(searchTerm)
+      || job.locationText.includes(searchTerm);
+    const matchScore = minScore === null || (job.score || 0) >= minScore;
 
     return matchCompany && matchLocation && matchExperience && matchWorkType && matchSearch && matchScore;
   });
 
-  if (filtered.length === 0) {
+  currentSearchTerm = searchTerm;
+  renderedRange = { start: -1, end: -1 };
+  document.getElementById('tableContainer').scrollTop = 0;
+  renderVisibleRows();
+}
+
+function renderJobRow(job) {
+  return `
+    <tr class="job-row">
+      <td>${highlightMatch(job.company ?? '', currentSearchTerm)}</td>
+      <td>${highlightMatch(job.location ?? '', currentSearchTerm)}</td>
+      <td>${highlightMatch(job.title ?? '', currentSearchTerm)}</td>
+      <td>${job.score ?? 'N/A'}</td>
+      <td>${escapeHtml(job.evaluation_notes ?? '')}</td>
+      <td><a href="${escapeHtml(job.url ?? '#')}" target="_blank">Apply</a></td>
+    </tr>
+  `;
+}
+
+function spacerRow(height) {
+  return height > 0 ? `<tr class="spacer-row" aria-hidden="true"><td colspan="6" style="height:${height}px"></td></tr>` : '';
+}
+
+// Only the rows in (and just around) the viewport exist in the DOM; spacer rows
+// keep the scrollbar sized to the full result set.
+function renderVisibleRows() {
+  const container = document.getElementById('tableContainer');
+  const tbody = document.querySelector('#jobsTable tbody');
+
+  if (filteredJobs.length === 0) {
     tbody.innerHTML = '<tr><td colspan="6" id="noResults">No jobs match your search or filters.</td></tr>';
     return;
   }
 
-  filtered.forEach((job, index) => {
-    const tr = document.createElement('tr');
-    tr.style.opacity = 0;
-    tr.innerHTML = `
-      <td>${highlightMatch(job.company ?? '', searchTerm)}</td>
-      <td>${highlightMatch(job.location ?? '', searchTerm)}</td>
-      <td>${highlightMatch(job.title ?? '', searchTerm)}</td>
-      <td>${job.score ?? 'N/A'}</td>
-      <td>${job.evaluation_notes ?? ''}</td>
-      <td><a href="${job.url ?? '#'}" target="_blank">Apply</a></td>
-    `;
+  // Body rows start below the header, and the sticky header covers the top of the
+  // viewport, so the rows on screen span [scrollTop + header, scrollTop + clientHeight].
+  const headerHeight = document.querySelector('#jobsTable thead').offsetHeight;
+  const viewTop = container.scrollTop + headerHeight;
+  const viewBottom = container.scrollTop + container.clientHeight;
+  const firstVisible = Math.floor((viewTop - headerHeight) / ROW_HEIGHT);
+  const lastVisible = Math.ceil((viewBottom - headerHeight) / ROW_HEIGHT);
+  const start = Math.max(0, firstVisible - OVERSCAN_ROWS);
+  const end = Math.min(filteredJobs.length, lastVisible + OVERSCAN_ROWS);
+  if (start === renderedRange.start && end === renderedRange.end) return;
+  renderedRange = { start, end };
+
+  tbody.innerHTML = spacerRow(start * ROW_HEIGHT)
+    + filteredJobs.slice(start, end).map(renderJobRow).join('')
+    + spacerRow((filteredJobs.length - end) * ROW_HEIGHT);
+}
 
-    tbody.appendChild(tr);
-    setTimeout(() => { tr.style.opacity = 1; }, index * 50);
+function onTableScroll() {
+  if (scrollFramePending) return;
+  scrollFramePending = true;
+  requestAnimationFrame(() => {
+    scrollFramePending = false;
+    renderVisibleRows();
   });
 }
 
@@ -184,12 +254,14 @@ function clearCustomSelect(hiddenId, wrapperId, defaultLabel) {
 }
 
 // Event listeners
-document.getElementById('companyFilter').addEventListener('change', renderJobs);
-document.getElementById('locationFilter').addEventListener('change', renderJobs);
-document.getElementById('experienceFilter').addEventListener('change', renderJobs);
-document.getElementById('workTypeFilter').addEventListener('change', renderJobs);
-document.getElementById('scoreFilter').addEventListener('change', renderJobs);
-document.getElementById('searchInput').addEventListener('input', renderJobs);
+document.getElementById('companyFilter').addEventListener('change', applyFilters);
+document.getElementById('locationFilter').addEventListener('change', applyFilters);
+document.getElementById('experienceFilter').addEventListener('change', applyFilters);
+document.getElementById('workTypeFilter').addEventListener('change', applyFilters);
+document.getElementById('scoreFilter').addEventListener('change', applyFilters);
+document.getElementById('searchInput').addEventListener('input', debounce(applyFilters, FILTER_DEBOUNCE_MS));
+document.getElementById('tableContainer').addEventListener('scroll', onTableScroll);
+window.addEventListener('resize', onTableScroll);
 
 document.getElementById('clearCompany').addEventListener('click', () => {
   clearCustomSelect('companyFilter', 'companyCustom', 'All Companies');
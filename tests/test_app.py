@@ -0,0 +1,88 @@
+import json
+import sqlite3
+
+import pytest
+
+pytest.importorskip("flask")
+pytest.importorskip("flask_cors")
+# The evaluator imports openai at module level.
+pytest.importorskip("evaluators.job_evaluator")
+
+import app as app_module  # noqa: E402
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return tmp_path / "jobs.db"
+
+
+@pytest.fixture
+def make_app(db_path, tmp_path, monkeypatch):
+    monkeypatch.setattr(app_module, "evaluate_job", lambda *args, **kwargs: {"score": 4.5, "notes": "good fit"})
+
+    def make(**config):
+        return app_module.create_app(
+            {"DB_PATH": str(db_path), "JOBS_JSON_PATH": str(tmp_path / "jobs.json"), "TESTING": True, **config}
+        )
+
+    return make
+
+
+def fetch_score(db_path, job_id):
+    conn = sqlite3.connect(db_path)
+    row = conn.execute("SELECT score, evaluation_notes FROM applications WHERE id = ?", (job_id,)).fetchone()
+    conn.close()
+    return row
+
+
+def test_read_routes(make_app):
+    client = make_app().test_client()
+
+    jobs = client.get("/jobs").get_json()
+    assert len(jobs) == 1
+    assert jobs[0]["company"] == "Example Corp"
+    assert jobs[0]["experience_level"] == "Mid"
+    assert client.get("/companies").get_json() == ["Example Corp"]
+    assert client.get("/locations").get_json() == ["Vancouver, BC"]
+
+
+def test_startup_hydrates_from_jobs_json(make_app, tmp_path):
+    (tmp_path / "jobs.json").write_text(
+        json.dumps([{"id": 1, "company": "Acme", "title": "Senior Engineer", "location": "Remote - US"}]),
+        encoding="utf-8",
+    )
+    app = make_app()
+    make_app()  # A second worker booting against the same DB changes nothing.
+
+    jobs = app.test_client().get("/jobs").get_json()
+    assert [(job["company"], job["work_type"]) for job in jobs] == [("Acme", "Remote"), ("Example Corp", "")]
+
+
+def test_read_connection_is_read_only(make_app):
+    app = make_app()
+    with app.app_context():
+        with pytest.raises(sqlite3.OperationalError, match="readonly"):
+            app_module.get_read_db().execute("DELETE FROM applications")
+
+
+def test_evaluate_writes_score(make_app, db_path):
+    client = make_app().test_client()
+
+    assert client.post("/evaluate/1").get_json() == {"score": 4.5, "notes": "good fit"}
+    assert fetch_score(db_path, 1) == (4.5, "good fit")
+    assert client.post("/evaluate/999").status_code == 404
+
+
+def test_evaluate_fails_without_writing_when_db_locked(make_app, db_path):
+    client = make_app(DB_WRITE_TIMEOUT=0.1).test_client()
+
+    locker = sqlite3.connect(db_path, isolation_level=None)
+    locker.execute("BEGIN IMMEDIATE")
+    try:
+        with pytest.raises(sqlite3.OperationalError, match="locked"):
+            client.post("/evaluate/1")
+    finally:
+        locker.execute("ROLLBACK")
+        locker.close()
+
+    assert fetch_score(db_path, 1) == (None, None)
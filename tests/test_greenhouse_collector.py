@@ -0,0 +1,47 @@
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("requests")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend" / "collectors"))
+
+import greenhouse_collector  # noqa: E402
+
+
+def create_baseline_schema(db_path):
+    """applications as created before the classification columns existed."""
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        """
+        CREATE TABLE applications (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            external_id TEXT, company TEXT, title TEXT, location TEXT, url TEXT, source TEXT,
+            date_posted TEXT, date_scraped TEXT, date_applied TEXT, status TEXT DEFAULT 'pending',
+            matched_skills TEXT, notes TEXT, score REAL, evaluation_notes TEXT, job_hash TEXT UNIQUE
+        )
+        """
+    )
+    conn.commit()
+    conn.close()
+
+
+def test_insert_into_pre_classification_db(tmp_path):
+    db_path = tmp_path / "jobs.db"
+    create_baseline_schema(db_path)
+
+    conn = greenhouse_collector.connect_db(db_path)
+    job = {
+        "external_id": "42",
+        "title": "Senior Engineer",
+        "location": "Remote - Canada",
+        "url": "https://boards.greenhouse.io/acme/jobs/42",
+        "date_posted": "2025-09-01",
+    }
+    assert greenhouse_collector.insert_job_if_new(conn, "acme", job)
+    assert not greenhouse_collector.insert_job_if_new(conn, "acme", job)
+
+    rows = conn.execute("SELECT company, experience_level, work_type FROM applications").fetchall()
+    conn.close()
+    assert rows == [("acme", "Senior", "Remote")]
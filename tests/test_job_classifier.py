@@ -0,0 +1,75 @@
+import sqlite3
+
+import pytest
+
+from classifiers.job_classifier import backfill_classifications, classify_experience, classify_work_type
+
+
+@pytest.mark.parametrize(
+    "title, expected",
+    [
+        ("", ""),
+        (None, ""),
+        ("Software Engineer", "Mid"),
+        ("Sr. Software Engineer", "Senior"),
+        ("Senior Data Analyst", "Senior"),
+        ("Head of Engineering", "Executive"),
+        ("Staff Engineer", "Executive"),
+        ("Junior Developer", "Entry"),
+        ("Software Engineering Intern", "Entry"),
+        # Entry keywords win over seniority keywords.
+        ("Senior Intern Program Lead", "Entry"),
+    ],
+)
+def test_classify_experience(title, expected):
+    assert classify_experience(title) == expected
+
+
+@pytest.mark.parametrize(
+    "location, title, expected",
+    [
+        ("", "", ""),
+        (None, None, ""),
+        ("Vancouver, BC", "Analyst", ""),
+        ("Remote - Canada", "Analyst", "Remote"),
+        ("Toronto", "Remote Support Analyst", "Remote"),
+        ("Remote or Hybrid, Toronto", "Analyst", "Hybrid"),
+        ("Toronto (On-site)", "Analyst", "On-Site"),
+        ("Onsite", "Analyst", "On-Site"),
+    ],
+)
+def test_classify_work_type(location, title, expected):
+    assert classify_work_type(location, title) == expected
+
+
+@pytest.fixture
+def conn():
+    conn = sqlite3.connect(":memory:")
+    conn.execute(
+        "CREATE TABLE applications (id INTEGER PRIMARY KEY, title TEXT, location TEXT, "
+        "experience_level TEXT, work_type TEXT)"
+    )
+    conn.executemany(
+        "INSERT INTO applications (title, location, experience_level, work_type) VALUES (?, ?, ?, ?)",
+        [
+            ("Senior Engineer", "Remote", None, None),
+            ("Junior Analyst", "Hybrid - Toronto", "Stale", "Stale"),
+        ],
+    )
+    yield conn
+    conn.close()
+
+
+def classifications(conn):
+    return conn.execute("SELECT experience_level, work_type FROM applications ORDER BY id").fetchall()
+
+
+def test_backfill_only_touches_unclassified_rows(conn):
+    assert backfill_classifications(conn) == 1
+    assert classifications(conn) == [("Senior", "Remote"), ("Stale", "Stale")]
+    assert backfill_classifications(conn) == 0
+
+
+def test_backfill_reclassify_updates_every_row(conn):
+    assert backfill_classifications(conn, reclassify=True) == 2
+    assert classifications(conn) == [("Senior", "Remote"), ("Entry", "Hybrid")]
@@ -0,0 +1,108 @@
+import gzip
+import json
+import sqlite3
+
+import pytest
+
+from db_init import init_db
+from snapshot_builder import build_snapshot, referenced_paths
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = tmp_path / "jobs.db"
+    init_db(path)
+    conn = sqlite3.connect(path)
+    conn.executemany(
+        "INSERT INTO applications (company, title, location, job_hash, experience_level, work_type) "
+        "VALUES (?, ?, ?, ?, ?, ?)",
+        [
+            ("Acme", "Senior Engineer", "Remote - Canada", "h1", "Senior", "Remote"),
+            ("Acme", "Data Analyst", "Toronto - ON", "h2", "Mid", ""),
+            ("Globex", "Junior Developer", "Toronto, ON", "h3", "Entry", ""),
+        ],
+    )
+    conn.commit()
+    conn.close()
+    return path
+
+
+def rename_job(db_path, job_hash, title):
+    conn = sqlite3.connect(db_path)
+    conn.execute("UPDATE applications SET title = ? WHERE job_hash = ?", (title, job_hash))
+    conn.commit()
+    conn.close()
+
+
+def read_gz_json(path):
+    return json.loads(gzip.decompress(path.read_bytes()))
+
+
+def hashed_files(out_dir):
+    return {
+        path.relative_to(out_dir).as_posix()
+        for path in out_dir.rglob("*")
+        if path.is_file() and path.name not in ("index.html", "manifest.json")
+    }
+
+
+def test_snapshot_contents(db_path, tmp_path):
+    out_dir = tmp_path / "snapshot"
+    manifest = build_snapshot(db_path, out_dir)
+
+    assert manifest["job_count"] == 4
+    all_jobs = read_gz_json(out_dir / manifest["jobs"]["path"])
+    assert [job["id"] for job in all_jobs] == sorted((job["id"] for job in all_jobs), reverse=True)
+
+    assert set(manifest["shards"]["company"]) == {"Acme", "Example Corp", "Globex"}
+    assert manifest["shards"]["location"]["Toronto, ON"]["count"] == 2
+    acme = read_gz_json(out_dir / manifest["shards"]["company"]["Acme"]["path"])
+    assert {job["title"] for job in acme} == {"Senior Engineer", "Data Analyst"}
+
+    facets = read_gz_json(out_dir / manifest["facets"])
+    assert {"name": "Remote", "count": 1} in facets["locations"]
+    assert {"name": "Entry", "count": 1} in facets["experience_levels"]
+
+    index = (out_dir / "index.html").read_text(encoding="utf-8")
+    assert "{{" not in index
+    assert '<meta name="job-snapshot-base" content=".">' in index
+    for hashed_path in manifest["assets"].values():
+        assert f'"{hashed_path}"' in index
+        assert (out_dir / hashed_path).exists()
+
+
+def test_hashes_stable_across_rebuilds(db_path, tmp_path):
+    out_dir = tmp_path / "snapshot"
+    first = build_snapshot(db_path, out_dir)
+    files = hashed_files(out_dir)
+    second = build_snapshot(db_path, out_dir)
+
+    assert referenced_paths(first) == referenced_paths(second)
+    assert hashed_files(out_dir) == files
+
+
+def test_prune_keeps_previous_manifest_files(db_path, tmp_path):
+    out_dir = tmp_path / "snapshot"
+    first = build_snapshot(db_path, out_dir)
+
+    rename_job(db_path, "h3", "Junior Developer II")
+    second = build_snapshot(db_path, out_dir)
+    first_globex = first["shards"]["company"]["Globex"]["path"]
+    assert second["shards"]["company"]["Globex"]["path"] != first_globex
+    # Clients holding the previous manifest can still fetch what it references.
+    assert referenced_paths(first) | referenced_paths(second) == hashed_files(out_dir)
+
+    rename_job(db_path, "h3", "Junior Developer III")
+    third = build_snapshot(db_path, out_dir)
+    assert not (out_dir / first_globex).exists()
+    assert referenced_paths(second) | referenced_paths(third) == hashed_files(out_dir)
+
+
+def test_unmigrated_db_fails_with_clear_error(tmp_path):
+    db_path = tmp_path / "old.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE applications (id INTEGER PRIMARY KEY, company TEXT, title TEXT, location TEXT, url TEXT)")
+    conn.close()
+
+    with pytest.raises(ValueError, match="experience_level, work_type.*db_init.py"):
+        build_snapshot(db_path, tmp_path / "snapshot")